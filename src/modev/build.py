@@ -1,19 +1,64 @@
+import os
 import sys
+import functools
 from pathlib import Path
-from marimo._ast.app import InternalApp
 from marimo import App
 import importlib
 import typer
 import yaml # Add yaml import
 import tomllib # To read project name for default export dir
-import re # Add re import for directive parsing
 import ast # Add ast import for import analysis
-from typing import List, Dict, Set, Tuple, Optional
+import json # For the on-disk incremental build manifest
+import hashlib # For notebook content hashes in the manifest
+import textwrap # For dedenting statically extracted cell bodies
+import tokenize # For encoding-aware reading of notebook sources
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Set, Tuple, Optional
+
+# Directories never containing exportable notebooks; pruned at the tree level.
+_SKIP_DIRS = {"__pycache__", ".ipynb_checkpoints", ".venv", ".git", "node_modules"}
+
+# Cell markers that tag a cell for export. '#| export' is the primary
+# (nbdev-style) form; '## Export' is the legacy marker still emitted by the
+# init template. One extraction implementation handles both.
+_EXPORT_MARKERS = ("#| export", "## Export")
+_EXPORT_MARKERS_BYTES = tuple(marker.encode() for marker in _EXPORT_MARKERS)
+
+# Sidecar manifest recording {notebook_path: [mtime_ns, sha256, output_path]}
+# so a fresh CLI process can skip notebooks that have not changed since the
+# last export.
+_MANIFEST_NAME = ".modev-cache.json"
 
 # --- Helper Functions ---
+def _parse_default_exp(code: str) -> str | None:
+    """
+    Looks for a '#| default_exp <name>' directive in the leading comment lines
+    of a cell. Returns the target filename (with '.py' appended if missing) or
+    None. Stops at the first non-comment, non-blank line, since directives are
+    documented to sit at the top of a cell.
+    """
+    for line in code.splitlines():
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        if not stripped.startswith('#'):
+            break
+        if stripped.startswith('#|'):
+            tokens = stripped[2:].split()
+            if len(tokens) >= 2 and tokens[0] == 'default_exp':
+                target_name = tokens[1]
+                if not target_name.endswith('.py'):
+                    target_name += '.py'
+                return target_name
+    return None
+
+@functools.lru_cache(maxsize=1)
 def find_project_root() -> Path:
     """Searches upwards from the current file to find the project root directory.
        Looks for modev.yaml or pyproject.toml as markers.
+
+       The result is cached for the lifetime of the process; use
+       `find_project_root.cache_clear()` to force a fresh search.
     """
     current_path = Path(__file__).resolve()
     check_path = current_path
@@ -22,8 +67,13 @@ def find_project_root() -> Path:
         check_path = Path.cwd()
 
     while True:
-        # Look for configuration or project file
-        if (check_path / 'modev.yaml').exists() or (check_path / 'pyproject.toml').exists():
+        # Look for configuration or project file. A single scandir per level
+        # replaces one stat() syscall per marker file.
+        try:
+            entries = {entry.name for entry in os.scandir(check_path)}
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            entries = set()
+        if 'modev.yaml' in entries or 'pyproject.toml' in entries:
             # typer.echo(f"Project root identified: {check_path} (found modev.yaml or pyproject.toml)")
             return check_path
 
@@ -35,22 +85,49 @@ def find_project_root() -> Path:
             return cwd
         check_path = parent_path
 
+@functools.lru_cache(maxsize=8)
+def _read_pyproject_name(path_str: str) -> str:
+    """Returns project.name from the given pyproject.toml, or '' on any error."""
+    try:
+        with open(path_str, "rb") as f:
+            return tomllib.load(f).get("project", {}).get("name", "")
+    except Exception:
+        return "" # Ignore errors reading pyproject; callers fall back
+
+@functools.lru_cache(maxsize=8)
+def _read_modev_yaml(path_str: str) -> dict:
+    """Parses the given modev.yaml, returning {} (with a warning) on any error."""
+    try:
+        with open(path_str, 'r') as f:
+            return yaml.safe_load(f) or {}
+    except yaml.YAMLError as e:
+        typer.secho(f"Warning: Error parsing {path_str}: {e}. Using default paths.", fg=typer.colors.YELLOW)
+    except IOError as e:
+        typer.secho(f"Warning: Could not read {path_str}: {e}. Using default paths.", fg=typer.colors.YELLOW)
+    except Exception as e:
+         typer.secho(f"Warning: Unexpected error reading {path_str}: {e}. Using default paths.", fg=typer.colors.YELLOW)
+    return {}
+
 def load_config(project_root: Path) -> tuple[Path, Path]:
     """Loads configuration from modev.yaml, falling back to defaults.
        Returns (notebooks_dir_path, export_dir_path).
+
+       Results are cached per project root so repeated exports in the same
+       process skip the YAML/TOML parsing; use `load_config.cache_clear()`
+       (exposed via the CLI's --no-cache flag) to re-read the files.
     """
+    return _load_config_cached(str(project_root.resolve()))
+
+@functools.lru_cache(maxsize=None)
+def _load_config_cached(project_root_str: str) -> tuple[Path, Path]:
+    project_root = Path(project_root_str)
     config_path = project_root / "modev.yaml"
     
     # Determine default project name for export dir fallback
     project_name = project_root.name # Default to root folder name
     pyproject_path = project_root / "pyproject.toml"
     if pyproject_path.exists():
-        try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
-                project_name = data.get("project", {}).get("name", project_name)
-        except Exception:
-            pass # Ignore errors reading pyproject, just use folder name
+        project_name = _read_pyproject_name(str(pyproject_path)) or project_name
 
     default_nbs_dir = "nbs"
     default_export_dir = f"src/{project_name}" # Default export dir
@@ -58,15 +135,7 @@ def load_config(project_root: Path) -> tuple[Path, Path]:
     config = {}
     if config_path.exists():
         typer.echo(f"Loading configuration from: {config_path}")
-        try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            typer.secho(f"Warning: Error parsing {config_path}: {e}. Using default paths.", fg=typer.colors.YELLOW)
-        except IOError as e:
-            typer.secho(f"Warning: Could not read {config_path}: {e}. Using default paths.", fg=typer.colors.YELLOW)
-        except Exception as e:
-             typer.secho(f"Warning: Unexpected error reading {config_path}: {e}. Using default paths.", fg=typer.colors.YELLOW)
+        config = _read_modev_yaml(str(config_path))
     else:
         typer.echo(f"Configuration file {config_path} not found. Using default paths.")
 
@@ -82,6 +151,14 @@ def load_config(project_root: Path) -> tuple[Path, Path]:
 
     return nbs_dir_path, export_dir_path
 
+def _clear_config_caches() -> None:
+    _load_config_cached.cache_clear()
+    _read_pyproject_name.cache_clear()
+    _read_modev_yaml.cache_clear()
+
+# Let callers clear the config caches without reaching for the private helpers.
+load_config.cache_clear = _clear_config_caches
+
 def transform_imports(code: str, notebook_relative_path: str, target_file: str, project_name: str) -> str:
     """
     Currently only warns about potentially problematic imports without transformations.
@@ -166,6 +243,201 @@ def transform_imports(code: str, notebook_relative_path: str, target_file: str,
                    f"Using original imports.", fg=typer.colors.RED)
         return code
 
+def _load_manifest(project_root: Path) -> dict:
+    """Loads the incremental build manifest, returning {} if absent or corrupt."""
+    manifest_path = project_root / _MANIFEST_NAME
+    try:
+        with open(manifest_path, 'r') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def _save_manifest(project_root: Path, manifest: dict) -> None:
+    """Writes the manifest atomically (tmp file + os.replace)."""
+    manifest_path = project_root / _MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix('.json.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        typer.secho(f"Warning: Could not write build manifest {manifest_path}: {e}", fg=typer.colors.YELLOW)
+
+def _iter_notebooks(root: Path) -> Iterator[Path]:
+    """
+    Yields candidate notebook .py files under root, skipping __init__.py and
+    pruning _SKIP_DIRS subtrees entirely (rglob would stat every entry in
+    __pycache__, .venv, etc. only for the loop to discard them).
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _SKIP_DIRS:
+                            stack.append(Path(entry.path))
+                    elif name.endswith('.py') and name != '__init__.py':
+                        yield Path(entry.path)
+        except (PermissionError, FileNotFoundError):
+            continue
+
+def _find_export_marker(code: str) -> tuple[str, int]:
+    """Returns (marker, index) for the first export marker that starts a line
+    of the cell code, or ('', -1) if the cell is not tagged for export.
+
+    Only whole comment lines count: a marker buried inside other content
+    (e.g. a markdown heading in mo.md('## Export ...')) must not classify
+    the cell as an export cell."""
+    offset = 0
+    for line in code.splitlines(keepends=True):
+        stripped = line.lstrip()
+        for marker in _EXPORT_MARKERS:
+            if stripped.startswith(marker):
+                return marker, offset + (len(line) - len(stripped))
+        offset += len(line)
+    return "", -1
+
+def _is_app_cell_decorator(decorator: ast.expr) -> bool:
+    """Returns True if the decorator node is `app.cell` or `app.cell(...)`."""
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    return (
+        isinstance(decorator, ast.Attribute)
+        and decorator.attr == "cell"
+        and isinstance(decorator.value, ast.Name)
+        and decorator.value.id == "app"
+    )
+
+def _collect_cell_defs(body: list[ast.stmt]) -> set[str]:
+    """Collects names defined by the top-level statements of a cell body."""
+    defs: set[str] = set()
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            defs.add(node.name)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    defs.add(target.id)
+                elif isinstance(target, (ast.Tuple, ast.List)):
+                    defs.update(elt.id for elt in target.elts if isinstance(elt, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            defs.add(node.target.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            # Imports bind names too (marimo counts them among a cell's defs).
+            for alias in node.names:
+                defs.add(alias.asname or alias.name.split('.')[0])
+    return defs
+
+def _extract_export_cells_ast(py_path: Path) -> list[tuple[str, str, set[str]]]:
+    """
+    Statically extracts marimo cell bodies from a notebook file without importing it.
+
+    Parses the file's AST, finds functions decorated with @app.cell, and recovers
+    each cell's body source (decorator, signature and trailing `return` stripped,
+    dedented), mirroring what marimo exposes as `cell.code`.
+
+    Returns a list of (cell_name, cell_code, cell_defs) tuples in file order.
+    Raises SyntaxError/OSError if the file cannot be read or parsed.
+    """
+    # tokenize.open honors a PEP 263 coding cookie, so non-UTF-8 notebooks
+    # decode the same way the import machinery would.
+    with tokenize.open(py_path) as f:
+        source = f.read()
+    lines = source.splitlines()
+    tree = ast.parse(source)
+
+    cells: list[tuple[str, str, set[str]]] = []
+    for node in tree.body:
+        # Cells using top-level await are emitted as async functions.
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if not any(_is_app_cell_decorator(d) for d in node.decorator_list):
+            continue
+        if not node.body:
+            continue
+
+        # Find the end of the `def` header (the line whose code ends with ':'),
+        # so comments between the header and the first statement are kept.
+        header_end = node.lineno - 1  # 0-based index of the `def` line
+        while header_end < len(lines) and not lines[header_end].split('#')[0].rstrip().endswith(':'):
+            header_end += 1
+
+        # Exclude marimo's trailing `return (...)` from the cell body.
+        last_stmt = node.body[-1]
+        if isinstance(last_stmt, ast.Return):
+            body_end = last_stmt.lineno - 1
+            body_stmts = node.body[:-1]
+        else:
+            body_end = last_stmt.end_lineno
+            body_stmts = node.body
+
+        body_lines = lines[header_end + 1:body_end]
+        cell_code = textwrap.dedent("\n".join(body_lines)).strip()
+        cells.append((node.name, cell_code, _collect_cell_defs(body_stmts)))
+
+    return cells
+
+def _extract_export_details_ast(py_path: Path, project_root: Path, project_name: str, notebook_relative_path: str) -> tuple[str | None, str, set[str]]:
+    """
+    AST-only counterpart of extract_export_details: pulls the #| default_exp
+    target and '#| export' cell code straight from the notebook source, without
+    importing the module or building marimo's dataflow graph.
+
+    Returns: (target_filename | None, code_export, all_defs)
+    Raises SyntaxError/OSError upward so callers can fall back to importing.
+    """
+    target_filename: str | None = None
+    code_parts: list[str] = []
+    all_defs: set[str] = set()
+
+    cells = _extract_export_cells_ast(py_path)
+
+    # --- 1. Find the first #| default_exp directive ---
+    for cell_name, cell_code, _cell_defs in cells:
+        target_name = _parse_default_exp(cell_code)
+        if target_name:
+            target_filename = target_name
+            typer.echo(f"  Found export directive in cell '{cell_name}': target filename set to '{target_filename}'")
+            break
+
+    # --- 2. Extract export-tagged code from all cells (in file order) ---
+    for cell_name, cell_code, cell_defs in cells:
+        # Locate the marker once: when only whitespace precedes it, the
+        # replacement below puts the origin comment at the top already.
+        marker, marker_idx = _find_export_marker(cell_code)
+        if marker_idx == -1:
+            continue
+
+        origin_comment = f"# Exported from {notebook_relative_path} (cell: {cell_name})"
+        # Substitute at the matched line, not the first substring occurrence.
+        cleaned_code = (cell_code[:marker_idx] + origin_comment + cell_code[marker_idx + len(marker):]).strip()
+
+        if cleaned_code:
+            if target_filename:
+                target_path = target_filename
+            else:
+                target_path = str(Path(notebook_relative_path).with_suffix('.py').name)
+
+            transformed_code = transform_imports(
+                cleaned_code,
+                notebook_relative_path,
+                target_path,
+                project_name
+            )
+
+            if cell_code[:marker_idx].strip():
+                code_parts.append(origin_comment + "\n" + transformed_code + "\n\n")
+            else:
+                code_parts.append(transformed_code + "\n\n")
+
+        all_defs.update(cell_defs)
+
+    return target_filename, "".join(code_parts).strip(), all_defs
+
 def extract_export_details(app: App, project_root: Path, project_name: str, notebook_relative_path: str) -> tuple[str | None, str, set[str]]:
     """
     Extracts target filename from the first #| default_exp directive encountered,
@@ -180,32 +452,27 @@ def extract_export_details(app: App, project_root: Path, project_name: str, note
     Returns: (target_filename | None, code_export, all_defs)
     """
     target_filename: str | None = None
-    code_export: str = ""
+    code_parts: list[str] = []
     all_defs: set[str] = set()
     relative_notebook_path_str = notebook_relative_path # Using the passed relative path
 
     try:
-        internal_app = InternalApp(app)
-        
-        # --- 1. Find the first #| default_exp directive --- 
-        # Iterate through cells (order might approximate definition, but we stop on first find)
-        for cell in internal_app.graph.cells.values():
-            if cell.language == "python":
-                # Regex to find #| default_exp name or #| default_exp name.py
-                match = re.search(r"^#\|\s*default_exp\s+(\S+)", cell.code, re.MULTILINE)
-                if match:
-                    target_name = match.group(1).strip()
-                    if not target_name:
-                        typer.secho(f"  Warning: Found '#| default_exp' directive but no filename specified in cell {cell.cell_id} of {getattr(app, '_filename', '?')}", fg=typer.colors.YELLOW)
-                    else:
-                        # Ensure it ends with .py
-                        if not target_name.endswith('.py'):
-                            target_name += '.py'
-                        target_filename = target_name
-                        typer.echo(f"  Found export directive in cell {cell.cell_id}: target filename set to '{target_filename}'")
-                    break # Stop searching once the first directive is found and processed
-
-        # --- 2. Extract #| export code from all cells (in execution order) --- 
+        # Read cell sources straight from the cell manager; building
+        # InternalApp's dataflow graph (dependency analysis, execution
+        # ordering) is wasted work when we only need each cell's code.
+        # Note: _cell_manager is marimo private API (marimo>=0.12.8).
+        cell_data = list(app._cell_manager.cell_data())
+
+        # --- 1. Find the first #| default_exp directive ---
+        # Iterate through cells (insertion order; we stop on first find)
+        for data in cell_data:
+            target_name = _parse_default_exp(data.code)
+            if target_name:
+                target_filename = target_name
+                typer.echo(f"  Found export directive in cell {data.cell_id}: target filename set to '{target_filename}'")
+                break # Stop searching once the first directive is found and processed
+
+        # --- 2. Extract #| export code from all cells (in file order) ---
         # Determine the relative path of the notebook file once (for origin comments)
         if hasattr(app, '_filename') and app._filename:
             try:
@@ -221,58 +488,154 @@ def extract_export_details(app: App, project_root: Path, project_name: str, note
         else:
              typer.secho("  Warning: Cannot determine notebook filename from app object. Origin comment will be incomplete.", fg=typer.colors.YELLOW)
 
-        order = internal_app.execution_order # Use execution order for export extraction
-        export_cells = {
-            k: v for k, v in internal_app.graph.cells.items()
-            if v.language == "python" and "#| export" in v.code # Filter for export tag
-        }
-
-        for cell_id in order:
-            if cell_id in export_cells:
-                cell = export_cells[cell_id]
-                origin_comment = f"# Exported from {relative_notebook_path_str} (cell ID: {cell.cell_id})"
-                cleaned_code = cell.code.replace("#| export", origin_comment, 1).strip()
-
-                if cleaned_code:
-                    # Apply import transformations
-                    if target_filename:
-                        target_path = target_filename
-                    else:
-                        # Default to using notebook name if no target specified
-                        target_path = str(Path(notebook_relative_path).with_suffix('.py').name)
-                        
-                    transformed_code = transform_imports(
-                        cleaned_code, 
-                        notebook_relative_path, 
-                        target_path, 
-                        project_name
-                    )
+        for data in cell_data:
+            # Locate the marker once: when only whitespace precedes it, the
+            # replacement below puts the origin comment at the top already.
+            marker, marker_idx = _find_export_marker(data.code)
+            if marker_idx == -1: # Filter for export tag
+                continue
+            origin_comment = f"# Exported from {relative_notebook_path_str} (cell ID: {data.cell_id})"
+            # Substitute at the matched line, not the first substring occurrence.
+            cleaned_code = (data.code[:marker_idx] + origin_comment + data.code[marker_idx + len(marker):]).strip()
+
+            if cleaned_code:
+                # Apply import transformations
+                if target_filename:
+                    target_path = target_filename
+                else:
+                    # Default to using notebook name if no target specified
+                    target_path = str(Path(notebook_relative_path).with_suffix('.py').name)
                     
-                    if not transformed_code.startswith(origin_comment):
-                         code_export += origin_comment + "\n" + transformed_code + "\n\n"
-                    else:
-                         code_export += transformed_code + "\n\n"
-
-                if hasattr(cell, 'defs'):
-                     all_defs.update(cell.defs)
+                transformed_code = transform_imports(
+                    cleaned_code,
+                    notebook_relative_path,
+                    target_path,
+                    project_name
+                )
+
+                if data.code[:marker_idx].strip():
+                     code_parts.append(origin_comment + "\n" + transformed_code + "\n\n")
                 else:
-                     typer.secho(f"  Warning: Cell {cell_id} lacks 'defs' attribute. Cannot extract names for __all__ from this cell.", fg=typer.colors.YELLOW)
+                     code_parts.append(transformed_code + "\n\n")
+
+            # Derive defined names locally instead of via marimo's graph analysis.
+            try:
+                all_defs.update(_collect_cell_defs(ast.parse(data.code).body))
+            except SyntaxError:
+                 typer.secho(f"  Warning: Could not parse cell {data.cell_id}. Cannot extract names for __all__ from this cell.", fg=typer.colors.YELLOW)
 
-        return target_filename, code_export.strip(), all_defs
+        return target_filename, "".join(code_parts).strip(), all_defs
 
     except Exception as e:
         notebook_name = getattr(app, '_filename', 'unknown notebook')
         typer.secho(f"  Error processing app from {notebook_name} with marimo: {e}", fg=typer.colors.YELLOW)
         return None, "", set() # Return defaults on error
 
-def run_export():
+def _process_one(project_root: Path, nbs_dir: Path, output_base_dir: Path, project_name: str, nbs_prefix: str, root_prefix: str, py_file: Path) -> tuple[Path, Path | None, str | None, str | None]:
+    """
+    Extracts export code for a single notebook (worker for the parallel loop
+    in run_export). Performs no disk writes.
+
+    The invariant arguments come first so run_export can bind them once with
+    functools.partial and hand the executor only py_file per task. The
+    prefixes are str(dir) + os.sep, computed once per run so relative paths
+    become a startswith + slice instead of two pathlib.relative_to traversals
+    per file.
+    Returns: (py_file, output_file_path, final_code, target_filename);
+    output path and code are None when there is nothing to export or on failure.
+    """
+    try:
+        spath = str(py_file)
+        if spath.startswith(nbs_prefix):
+            relative_notebook_path = Path(spath[len(nbs_prefix):])
+        else:
+            relative_notebook_path = py_file.relative_to(nbs_dir)
+        if spath.startswith(root_prefix):
+            notebook_rel_str = spath[len(root_prefix):].replace('\\', '/')
+            relative_path_for_import = Path(notebook_rel_str)
+        else:
+            relative_path_for_import = py_file.relative_to(project_root)
+            notebook_rel_str = str(relative_path_for_import).replace('\\', '/')
+    except ValueError as e:
+        typer.secho(f"Warning: Could not determine relative path for {py_file} within {nbs_dir} or {project_root}. Skipping. Error: {e}", fg=typer.colors.YELLOW)
+        return py_file, None, None, None
+    except Exception as e:
+        typer.secho(f"Warning: Error calculating paths for {py_file}. Skipping. Error: {e}", fg=typer.colors.YELLOW)
+        return py_file, None, None, None
+
+    try:
+        module_name = '.'.join(relative_path_for_import.with_suffix('').parts)
+        default_output_path = output_base_dir / relative_notebook_path
+
+        # Extract statically from the AST; this avoids executing the
+        # notebook's top-level code and importing its dependencies.
+        extracted = None
+        try:
+            extracted = _extract_export_details_ast(
+                py_file,
+                project_root,
+                project_name,
+                notebook_rel_str
+            )
+        except (SyntaxError, UnicodeDecodeError, ValueError, OSError) as e:
+            typer.secho(f"  Warning: Could not statically parse {py_file.name}: {e}. Falling back to importing the module.", fg=typer.colors.YELLOW)
+
+        if extracted is None:
+            # Fallback: import the module and go through marimo's App object.
+            try:
+                module = importlib.import_module(module_name)
+
+                if hasattr(module, 'app') and isinstance(getattr(module, 'app'), App):
+                    extracted = extract_export_details(
+                        getattr(module, 'app'),
+                        project_root,
+                        project_name,
+                        notebook_rel_str
+                    )
+            except ImportError as e:
+                typer.secho(f"  Error importing module {module_name} from {py_file}: {e}", fg=typer.colors.RED)
+            except Exception as e:
+                typer.secho(f"  Unexpected error processing file {py_file}: {e}", fg=typer.colors.RED)
+
+        if extracted is None:
+            return py_file, None, None, None
+
+        target_filename, file_code, defined_names = extracted
+        if not file_code: # Only proceed if there is code tagged with #| export
+            return py_file, None, None, None
+
+        # Determine final output path
+        if target_filename:
+            output_file_path = output_base_dir / target_filename
+        else:
+            output_file_path = default_output_path
+
+        # Prepare code with __all__ (one pass: filter, sort, and format directly)
+        dunder_all_string = f"__all__ = {sorted(name for name in defined_names if not name.startswith('_'))!r}\n\n"
+        return py_file, output_file_path, dunder_all_string + file_code, target_filename
+    except Exception as e:
+        # Catch-all: a failure in one worker must degrade to a skipped
+        # file, not abort the whole executor.map run.
+        typer.secho(f"  Unexpected error while processing {py_file}: {e}. Skipping.", fg=typer.colors.RED)
+        return py_file, None, None, None
+
+def run_export(force: bool = False, jobs: int | None = None):
     """
     Finds marimo apps based on modev.yaml config, extracts tagged code using #| default_exp
     or notebook filename, generates __all__, adds origin comments, and writes to the export directory.
+
+    Notebooks whose mtime and content hash match the on-disk manifest
+    (.modev-cache.json) from the previous run are skipped entirely; pass
+    force=True to re-export everything. jobs caps the worker pool size
+    (default: os.cpu_count()).
     """
     processed_files_count = 0
     exported_files_count = 0
-    written_files = set()
+    skipped_files_count = 0
+    no_marker_count = 0
+    # Reverse map output path -> source notebook, so directive collisions can
+    # name both notebooks and the redundant write can be skipped.
+    notebook_of_target: dict[Path, Path] = {}
 
     try:
         project_root = find_project_root()
@@ -280,16 +643,11 @@ def run_export():
         # Load configuration
         nbs_dir, output_base_dir = load_config(project_root)
         
-        # Determine project name for import handling
+        # Determine project name for import handling (cached TOML read)
         project_name = project_root.name # Default to directory name
         pyproject_path = project_root / "pyproject.toml"
         if pyproject_path.exists():
-            try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    project_name = data.get("project", {}).get("name", project_name)
-            except Exception:
-                pass # Ignore errors, just use the default
+            project_name = _read_pyproject_name(str(pyproject_path)) or project_name
 
         # Ensure export directory exists
         output_base_dir.mkdir(parents=True, exist_ok=True)
@@ -307,81 +665,115 @@ def run_export():
             typer.secho(f"Error: Configured notebooks directory does not exist or is not a directory: {nbs_dir}", fg=typer.colors.RED)
             raise typer.Exit(code=1)
 
-        python_files = list(nbs_dir.rglob('*.py'))
+        python_files = list(_iter_notebooks(nbs_dir))
         typer.echo(f"Found {len(python_files)} Python files in {nbs_dir}")
 
-        with typer.progressbar(python_files, label="Processing notebooks") as progress:
-            for py_file in progress:
-                processed_files_count += 1
-                try:
-                    relative_notebook_path = py_file.relative_to(nbs_dir)
-                    relative_path_for_import = py_file.relative_to(project_root)
-                    notebook_rel_str = str(relative_path_for_import).replace('\\', '/')
-
-                    if py_file.name == '__init__.py':
+        # Incremental build: skip notebooks whose mtime and content hash match
+        # the manifest from the previous run and whose output still exists.
+        manifest = {} if force else _load_manifest(project_root)
+        file_sigs: dict[str, tuple[int, str]] = {}
+        sized_files: list[tuple[int, Path]] = []
+        for py_file in python_files:
+            spath = str(py_file)
+            try:
+                st = py_file.stat()
+                raw = py_file.read_bytes()
+            except OSError:
+                sized_files.append((0, py_file))
+                continue
+            # Coarse pre-check on the raw bytes (memchr-fast): a notebook with
+            # no export marker anywhere has nothing to export, so skip parsing
+            # it entirely.
+            if not any(marker in raw for marker in _EXPORT_MARKERS_BYTES):
+                no_marker_count += 1
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            file_sigs[spath] = (st.st_mtime_ns, digest)
+            entry = manifest.get(spath)
+            if (entry and entry[0] == st.st_mtime_ns and entry[1] == digest
+                    and Path(entry[2]).exists()):
+                skipped_files_count += 1
+                # A skipped notebook still owns its output: record the claim so
+                # a colliding default_exp from another notebook is detected (and
+                # skipped) even when this one never reaches the result loop.
+                notebook_of_target[Path(entry[2])] = py_file
+                continue
+            sized_files.append((st.st_size, py_file))
+
+        # Dispatch largest notebooks first (processing time tracks file size),
+        # so the pool is not left waiting on one big straggler at the end.
+        sized_files.sort(key=lambda sf: sf[0], reverse=True)
+        files_to_process = [py_file for _size, py_file in sized_files]
+
+        # Precompute string prefixes so workers can slice instead of calling
+        # pathlib.relative_to per file.
+        nbs_prefix = str(nbs_dir) + os.sep
+        root_prefix = str(project_root) + os.sep
+        # Bind the run-invariant arguments once; each task then carries only
+        # its py_file.
+        worker = functools.partial(_process_one, project_root, nbs_dir, output_base_dir, project_name, nbs_prefix, root_prefix)
+
+        # Bind hot attribute chains to locals; the result loop below touches
+        # them once or more per notebook.
+        _secho = typer.secho
+        _echo = typer.echo
+        _YELLOW = typer.colors.YELLOW
+        _RED = typer.colors.RED
+        _get_target_notebook = notebook_of_target.get
+
+        # Extraction is independent per notebook, so fan it out across threads.
+        # Disk writes (and the written_files overwrite bookkeeping) stay
+        # serialized in the parent below.
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+            results = executor.map(worker, files_to_process)
+            with typer.progressbar(results, length=len(files_to_process), label="Processing notebooks") as progress:
+                for py_file, output_file_path, final_code_to_write, target_filename in progress:
+                    processed_files_count += 1
+                    if output_file_path is None or final_code_to_write is None:
                         continue
 
-                    module_name = '.'.join(relative_path_for_import.with_suffix('').parts)
-                    default_output_path = output_base_dir / relative_notebook_path
-
+                    if target_filename:
+                        # Skip if this specific filename was already written by another notebook via default_exp
+                        first_notebook = _get_target_notebook(output_file_path)
+                        if first_notebook is not None:
+                             _secho(f"  Warning: Skipping {output_file_path}: '#| default_exp {target_filename}' in {py_file.name} collides with {first_notebook.name}, which already generated it this run.", fg=_YELLOW)
+                             continue
+                        elif output_file_path.exists():
+                            # Warn if the file exists but wasn't from *this run* (less severe warning)
+                             _secho(f"  Warning: Overwriting existing file {output_file_path} specified by '#| default_exp {target_filename}' in {py_file.name}", fg=_YELLOW)
+                        notebook_of_target[output_file_path] = py_file # Track files written via directive
+
+                    # Write the file, unless the on-disk content already matches
+                    # (avoids invalidating mtime-based caches in downstream tools).
                     try:
-                        module = importlib.import_module(module_name)
-
-                        if hasattr(module, 'app') and isinstance(getattr(module, 'app'), App):
-                            app_object = getattr(module, 'app')
-                            
-                            # Pass project name and notebook_rel_str to extract_export_details
-                            target_filename, file_code, defined_names = extract_export_details(
-                                app_object, 
-                                project_root, 
-                                project_name,  # Using the project_name from above
-                                notebook_rel_str
-                            )
-
-                            if file_code: # Only proceed if there is code tagged with #| export
-                                # Determine final output path
-                                if target_filename:
-                                    output_file_path = output_base_dir / target_filename
-                                    # Warn if this specific filename was already written by another notebook via default_exp
-                                    if output_file_path in written_files:
-                                         typer.secho(f"  Warning: Overwriting {output_file_path} which was already generated by another notebook's '#| default_exp {target_filename}' directive.", fg=typer.colors.YELLOW)
-                                    elif output_file_path.exists():
-                                        # Warn if the file exists but wasn't from *this run* (less severe warning)
-                                         typer.secho(f"  Warning: Overwriting existing file {output_file_path} specified by '#| default_exp {target_filename}' in {py_file.name}", fg=typer.colors.YELLOW)
-                                    written_files.add(output_file_path) # Track files written via directive
-                                else:
-                                    output_file_path = default_output_path
-
-                                # Prepare code with __all__
-                                public_names = {name for name in defined_names if not name.startswith('_')}
-                                dunder_all_list = sorted(list(public_names))
-                                dunder_all_string = f"__all__ = {repr(dunder_all_list)}\n\n"
-                                final_code_to_write = dunder_all_string + file_code
-
-                                # Write the file
-                                try:
-                                    output_file_path.parent.mkdir(parents=True, exist_ok=True)
-                                    output_file_path.write_text(final_code_to_write)
-                                    exported_files_count += 1
-                                except IOError as e:
-                                    typer.secho(f"  Error writing to output file {output_file_path}: {e}", fg=typer.colors.RED)
-                                except Exception as e:
-                                    typer.secho(f"  Unexpected error writing file {output_file_path}: {e}", fg=typer.colors.RED)
-
-                    except ImportError as e:
-                        typer.secho(f"  Error importing module {module_name} from {py_file}: {e}", fg=typer.colors.RED)
+                        sig = file_sigs.get(str(py_file))
+                        # Encode once up front; write_bytes skips the locale and
+                        # newline handling of text mode, and the generated code
+                        # already uses \n line endings throughout.
+                        encoded_code = final_code_to_write.encode("utf-8")
+                        if output_file_path.exists() and output_file_path.read_bytes() == encoded_code:
+                            _echo(f"  Unchanged: {output_file_path}")
+                            if sig:
+                                manifest[str(py_file)] = [sig[0], sig[1], str(output_file_path)]
+                            continue
+                        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+                        output_file_path.write_bytes(encoded_code)
+                        exported_files_count += 1
+                        if sig:
+                            manifest[str(py_file)] = [sig[0], sig[1], str(output_file_path)]
+                    except IOError as e:
+                        _secho(f"  Error writing to output file {output_file_path}: {e}", fg=_RED)
                     except Exception as e:
-                        typer.secho(f"  Unexpected error processing file {py_file}: {e}", fg=typer.colors.RED)
+                        _secho(f"  Unexpected error writing file {output_file_path}: {e}", fg=_RED)
 
-                except ValueError as e:
-                    typer.secho(f"Warning: Could not determine relative path for {py_file} within {nbs_dir} or {project_root}. Skipping. Error: {e}", fg=typer.colors.YELLOW)
-                    continue
-                except Exception as e:
-                    typer.secho(f"Warning: Error calculating paths for {py_file}. Skipping. Error: {e}", fg=typer.colors.YELLOW)
-                    continue
+        _save_manifest(project_root, manifest)
 
         typer.echo(f"\n--- Summary ---")
         typer.echo(f"Processed {processed_files_count}/{len(python_files)} Python files from {nbs_dir}.")
+        if skipped_files_count:
+            typer.echo(f"Skipped {skipped_files_count} unchanged notebooks (manifest cache; use --force to re-export).")
+        if no_marker_count:
+            typer.echo(f"Skipped {no_marker_count} notebooks with no export markers.")
         typer.echo(f"Successfully exported code to {exported_files_count} files in {output_base_dir}.")
 
     except FileNotFoundError as e:
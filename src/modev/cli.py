@@ -1,5 +1,5 @@
 import typer
-from .build import run_export # Use relative import
+from .build import run_export, find_project_root, load_config # Use relative import
 import tomllib # Use tomllib for Python >= 3.11
 from pathlib import Path
 import sys
@@ -104,17 +104,37 @@ def init():
     else:
         typer.echo(f"Configuration file already exists: {config_path}")
 
+    # --- Ensure the incremental export cache is git-ignored ---
+    gitignore_path = project_root / ".gitignore"
+    try:
+        existing = gitignore_path.read_text() if gitignore_path.exists() else ""
+        if ".modev-cache.json" not in existing:
+            typer.echo(f"Adding .modev-cache.json to {gitignore_path}")
+            with open(gitignore_path, "a") as f:
+                if existing and not existing.endswith("\n"):
+                    f.write("\n")
+                f.write(".modev-cache.json\n")
+    except OSError as e:
+        typer.secho(f"Warning: Could not update {gitignore_path}: {e}", fg=typer.colors.YELLOW)
+
     typer.echo("\nModev initialization complete.")
     typer.echo(f"- Notebooks directory: {nbs_dir}")
     typer.echo(f"- Config file: {config_path}")
 
 @app.command()
-def export():
+def export(
+    no_cache: bool = typer.Option(False, "--no-cache", help="Clear cached project root and configuration before exporting."),
+    force: bool = typer.Option(False, "--force", help="Re-export all notebooks, ignoring the incremental build manifest."),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Number of parallel workers (default: number of CPUs)."),
+):
     """
     Finds marimo apps in nbs/*.py, extracts tagged code, and writes to src/modev/core.py.
     """
     try:
-        run_export() # This will need to be updated to use modev.yaml
+        if no_cache:
+            find_project_root.cache_clear()
+            load_config.cache_clear()
+        run_export(force=force, jobs=jobs) # This will need to be updated to use modev.yaml
     except typer.Exit:
         # Catch exits from run_export to prevent further processing if needed
         raise # Re-raise the Exit exception